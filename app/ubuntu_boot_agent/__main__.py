@@ -5,9 +5,11 @@ import sys
 import time
 from pathlib import Path
 
-from .gui import main as gui_main
-from .log_capture import capture_boot_logs, capture_priority_logs, get_failed_services
-from .analyzer import analyze_logs
+# Heavier modules (Qt, httpx) are imported in the branches that need them
+# so --help and --capture-only start quickly.
+
+# Optional issue fields printed in CLI mode, in display order
+ISSUE_FIELDS = (("Details", "details"), ("Remediation", "remediation"))
 
 
 def cli_main():
@@ -50,6 +52,8 @@ def cli_main():
 
     if args.capture_only:
         # Just capture logs
+        from .log_capture import capture_boot_logs
+
         log_path = capture_boot_logs(args.output)
         print(f"Boot logs captured to: {log_path}")
         return 0
@@ -57,14 +61,41 @@ def cli_main():
     if args.no_gui:
         # CLI mode
         import json
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .analyzer import analyze_logs, warm_up_connection
+        from .log_capture import get_failed_services, read_analysis_logs
+
+        # Connect to the API while journalctl is running
+        threading.Thread(target=warm_up_connection, daemon=True).start()
 
         print("Capturing boot logs...")
-        log_path = capture_priority_logs()
-        log_content = log_path.read_text()
-        failed_services = get_failed_services()
+        # journalctl and systemctl are independent; run them side by side
+        # Logs are streamed straight into memory; no temp file is needed here
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            log_future = executor.submit(read_analysis_logs)
+            failed_future = executor.submit(get_failed_services)
+            log_content = log_future.result()
+            failed_services = failed_future.result()
 
         print("Analyzing logs with AI...")
-        results = analyze_logs(log_content, failed_services)
+        received = 0
+
+        def show_progress(chunk: str):
+            # Live counter while the response streams in (terminals only)
+            nonlocal received
+            received += len(chunk)
+            sys.stderr.write(f"\rReceiving analysis... ({received} characters)")
+            sys.stderr.flush()
+
+        results = analyze_logs(
+            log_content,
+            failed_services,
+            on_progress=show_progress if sys.stderr.isatty() else None
+        )
+        if received:
+            sys.stderr.write("\n")
 
         print("\n" + "=" * 60)
         print("BOOT LOG ANALYSIS RESULTS")
@@ -76,18 +107,21 @@ def cli_main():
         if not issues:
             print("No significant issues detected.")
         else:
+            # One write per issue rather than a print() per line
             for i, issue in enumerate(issues, 1):
                 severity = issue.get("severity", "notice").upper()
-                print(f"[{severity}] Issue #{i}: {issue.get('problem', 'Unknown')}")
-                if details := issue.get("details"):
-                    print(f"  Details: {details}")
-                if remediation := issue.get("remediation"):
-                    print(f"  Remediation: {remediation}")
-                print()
+                parts = [f"[{severity}] Issue #{i}: {issue.get('problem', 'Unknown')}"]
+                for label, key in ISSUE_FIELDS:
+                    if value := issue.get(key):
+                        parts.append(f"  {label}: {value}")
+                sys.stdout.write("\n".join(parts) + "\n\n")
+            sys.stdout.flush()
 
         return 0
     else:
         # GUI mode
+        from .gui import main as gui_main
+
         gui_main()
         return 0
 
@@ -1,14 +1,26 @@
 """Log analysis module using OpenRouter/Claude API."""
 
+import atexit
+import functools
+import gzip
+import hashlib
 import os
 import json
-import httpx
+import math
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
 from pathlib import Path
-from dotenv import load_dotenv
 
-load_dotenv()
+import httpx
+import orjson
+
+from .log_capture import read_log_tail
 
 
+@functools.cache
 def get_config_dir() -> Path:
     """Get the XDG config directory for the application."""
     xdg_config = os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")
@@ -17,17 +29,61 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@functools.cache
+def get_cache_dir() -> Path:
+    """Get the XDG cache directory for the application."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    cache_dir = Path(xdg_cache) / "ubuntu-boot-agent"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Cached analyses quote the logs; keep them private like config.json
+    os.chmod(cache_dir, 0o700)
+    return cache_dir
+
+
+def _load_config() -> dict:
+    """Load the config file, or an empty config if it is missing or unreadable."""
+    try:
+        config = orjson.loads((get_config_dir() / "config.json").read_bytes())
+    except (orjson.JSONDecodeError, IOError):
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
+def _save_config(**values) -> None:
+    """Update keys in the config file."""
+    config_file = get_config_dir() / "config.json"
+    config = _load_config()
+    config.update(values)
+
+    # Write to a private temp file and rename it into place, so an
+    # interrupted write can't leave a truncated config behind
+    tmp_file = config_file.with_suffix(".json.tmp")
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            # Make the data durable before the rename can reach the disk
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, config_file)
+    finally:
+        # Already gone after a successful rename; left over if the write failed
+        tmp_file.unlink(missing_ok=True)
+    # The file holds an API key; also tighten configs written by older versions
+    os.chmod(config_file, 0o600)
+
+
+@functools.cache
 def get_api_key() -> str:
-    """Get API key from config file or environment."""
+    """
+    Get API key from config file or environment.
+
+    The result is cached for the life of the process; save_api_key()
+    clears the cache when the key changes.
+    """
     # First check config file
-    config_file = get_config_dir() / "config.json"
-    if config_file.exists():
-        try:
-            config = json.loads(config_file.read_text())
-            if api_key := config.get("openrouter_api_key"):
-                return api_key
-        except (json.JSONDecodeError, IOError):
-            pass
+    if api_key := _load_config().get("openrouter_api_key"):
+        return api_key
 
     # Fall back to environment
     return os.getenv("OPENROUTER_API_KEY") or os.getenv("OPENROUTER_API") or ""
@@ -35,23 +91,264 @@ def get_api_key() -> str:
 
 def save_api_key(api_key: str) -> None:
     """Save API key to config file."""
-    config_file = get_config_dir() / "config.json"
+    _save_config(openrouter_api_key=api_key)
+    get_api_key.cache_clear()
+
+
+def __getattr__(name: str):
+    # For backward compatibility: OPENROUTER_API_KEY used to be read at import time
+    if name == "OPENROUTER_API_KEY":
+        return get_api_key()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+MODEL = "anthropic/claude-sonnet-4"
+
+# Markdown code fence the model sometimes wraps its JSON in
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+
+# Rate limiting and transient gateway errors are retried with backoff
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_ATTEMPTS = 3
+_MAX_RETRY_DELAY = 10.0
+
+# Request bodies embed the log excerpt, which compresses very well
+_GZIP_MIN_BYTES = 1024
+# Cache directory marker recording that the server refused compressed bodies
+_GZIP_REJECTED_MARKER = "gzip_rejected"
+
+# Boot log excerpt included in chat context; it is re-sent on every turn
+CHAT_LOG_CHARS = 80_000
+# Lines from the start of the boot kept in the excerpt (kernel, hardware)
+CHAT_HEAD_LINES = 50
+
+# How long a cached analysis of identical input is reused, in seconds
+ANALYSIS_CACHE_TTL = 3600
 
-    # Load existing config or create new
-    config = {}
-    if config_file.exists():
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring the Retry-After header."""
+    try:
+        delay = float(response.headers.get("Retry-After", 2 ** attempt))
+    except ValueError:
+        # Retry-After given as an HTTP date; fall back to exponential backoff
+        delay = 2 ** attempt
+    if not math.isfinite(delay):
+        delay = 2 ** attempt
+    return min(max(0.0, delay), _MAX_RETRY_DELAY) + random.uniform(0, 0.5)
+
+
+def _gzip_allowed() -> bool:
+    """Whether to compress request bodies, i.e. no earlier run found them refused."""
+    try:
+        return not (get_cache_dir() / _GZIP_REJECTED_MARKER).exists()
+    except IOError:
+        return True
+
+
+def _remember_gzip_rejected() -> None:
+    """Record that compressed bodies are refused; clearing the cache resets this."""
+    try:
+        (get_cache_dir() / _GZIP_REJECTED_MARKER).touch()
+    except IOError:
+        pass
+
+
+class OpenRouterClient:
+    """
+    Client for the OpenRouter chat completions API.
+
+    Holds the pooled HTTP/2 connection with the API key and static headers
+    pre-bound, and applies the same retry and compression handling to
+    every request.
+    """
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        # Turned off, for this and later runs, if the server rejects a compressed body
+        self.gzip_requests = _gzip_allowed()
+        self._http = httpx.Client(
+            # Pool settings live on the transport; retries only cover failed connects
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                retries=2
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": "https://github.com/danielrosehill/Ubuntu-AI-Boot-Agent",
+                "X-Title": "Ubuntu Boot Monitoring Agent"
+            }
+        )
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._http.close()
+
+    def warm_up(self) -> None:
+        """Open a connection with a cheap request; errors are ignored."""
         try:
-            config = json.loads(config_file.read_text())
-        except (json.JSONDecodeError, IOError):
+            self._http.head(OPENROUTER_URL)
+        except httpx.HTTPError:
             pass
 
-    config["openrouter_api_key"] = api_key
-    config_file.write_text(json.dumps(config, indent=2))
+    def complete(
+        self,
+        messages: list,
+        *,
+        temperature: float,
+        max_tokens: int,
+        on_delta: Callable[[str], None] | None = None
+    ) -> str:
+        """
+        Run a chat completion and return the response text.
+
+        The response is streamed, so on_delta sees the text as it is generated.
+
+        Args:
+            messages: Chat messages in OpenAI format.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens to generate.
+            on_delta: Optional callback receiving each chunk of response text.
+
+        Returns:
+            The full response text.
+
+        Raises:
+            httpx.HTTPStatusError: If the request still fails after retries.
+            RuntimeError: If the API reports an error mid-stream.
+        """
+        response = self._post({
+            "model": MODEL,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
+        })
+
+        chunks = []
+        try:
+            # Server-sent events: "data: {...}" lines, ": ..." keep-alive comments
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+
+                event = orjson.loads(data)
+                if error := event.get("error"):
+                    raise RuntimeError(error.get("message", "Stream interrupted"))
+
+                for choice in event.get("choices", []):
+                    if delta := choice.get("delta", {}).get("content"):
+                        chunks.append(delta)
+                        if on_delta:
+                            on_delta(delta)
+        finally:
+            response.close()
+
+        return "".join(chunks)
+
+    def _build_request(self, payload: dict, compress: bool) -> httpx.Request:
+        """Build a chat completions request, gzip-compressing larger bodies."""
+        body = orjson.dumps(payload)
+        headers = {}
+        if compress and len(body) >= _GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        return self._http.build_request("POST", OPENROUTER_URL, headers=headers, content=body)
+
+    def _post(self, payload: dict) -> httpx.Response:
+        """POST a payload, falling back to an uncompressed body if needed."""
+        request = self._build_request(payload, self.gzip_requests)
+        try:
+            return self._send(request)
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if (
+                "Content-Encoding" not in request.headers
+                or not e.response.is_client_error
+                or status in _RETRY_STATUSES
+            ):
+                raise
+
+        # Servers report an undecodable body in different ways, so any client
+        # error is worth one retry as plain JSON. If that fails too, the body
+        # was not the problem and its error is the one raised.
+        response = self._send(self._build_request(payload, False))
+
+        # The plain body worked, so the compression was refused; stop
+        # compressing, in later runs too
+        self.gzip_requests = False
+        _remember_gzip_rejected()
+        return response
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request, retrying 429 and 5xx gateway errors.
+
+        The response body is left unread for streaming; the caller is
+        responsible for closing it.
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            response = self._http.send(request, stream=True)
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS - 1:
+                break
+            response.close()
+            time.sleep(_retry_delay(response, attempt))
+
+        if not response.is_success:
+            # Error bodies are small; reading one also closes the response
+            response.read()
+            response.raise_for_status()
+        return response
 
 
-# For backward compatibility
-OPENROUTER_API_KEY = get_api_key()
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+# Shared client, created on first use so connections are reused across calls
+_CLIENT: OpenRouterClient | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _close_client() -> None:
+    if _CLIENT is not None:
+        _CLIENT.close()
+
+
+atexit.register(_close_client)
+
+
+def _get_client(api_key: str) -> OpenRouterClient:
+    """Get the shared client, replacing it if the API key has changed."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT.api_key != api_key:
+            if _CLIENT is not None:
+                _CLIENT.close()
+            _CLIENT = OpenRouterClient(api_key)
+        return _CLIENT
+
+
+def warm_up_connection(use_cache: bool = True) -> None:
+    """
+    Open the connection to OpenRouter ahead of the first API request.
+
+    Meant to run in a background thread while logs are being captured, so
+    the TCP/TLS handshake overlaps with journalctl instead of delaying the
+    analysis request. Failures are ignored; the real request will report them.
+
+    Does nothing without an API key, or when use_cache is set and a recent
+    analysis may answer without any request (the logs aren't known yet, so
+    any unexpired cache entry counts).
+    """
+    api_key = get_api_key()
+    if not api_key or (use_cache and _analysis_cache_may_answer()):
+        return
+    _get_client(api_key).warm_up()
+
 
 SYSTEM_PROMPT = """You are a Linux system administrator expert analyzing boot logs from an Ubuntu system.
 
@@ -102,13 +399,198 @@ If no significant issues are found, return:
 """
 
 
-def analyze_logs(log_content: str, failed_services: str = "") -> dict:
+def _tail_lines(text: str, max_chars: int) -> str:
+    """Return at most the last max_chars of text, starting at a line boundary."""
+    if len(text) <= max_chars:
+        return text
+    # One extra character: if it is a newline, the tail starts on a whole line
+    tail = text[-max_chars - 1:]
+    newline = tail.find("\n")
+    return tail[newline + 1:] if newline != -1 else tail[1:]
+
+
+def _log_digest(text: str, max_chars: int, head_lines: int) -> str:
+    """
+    Condense a log to its first head_lines lines plus as much of its end
+    as fits in max_chars.
+    """
+    if len(text) <= max_chars:
+        return text
+    head = "\n".join(text.split("\n", head_lines)[:head_lines])[:max_chars // 4]
+    tail = _tail_lines(text, max_chars - len(head) - len("\n[...]\n"))
+    return f"{head}\n[...]\n{tail}"
+
+
+def _file_log_digest(log_path: Path, max_chars: int, head_lines: int) -> str:
+    """Like _log_digest, but only reads the start and end of a log file."""
+    with log_path.open("rb") as f:
+        if f.seek(0, 2) <= max_chars:
+            f.seek(0)
+            return _log_digest(f.read().decode("utf-8", errors="replace"), max_chars, head_lines)
+        f.seek(0)
+        head = b"".join(f.readline(max_chars) for _ in range(head_lines))
+
+    head = head.decode("utf-8", errors="replace").removesuffix("\n")[:max_chars // 4]
+    tail = read_log_tail(log_path, max_chars - len(head) - len("\n[...]\n"))
+    return f"{head}\n[...]\n{tail}"
+
+
+class ChatContext:
+    """
+    Boot log context shared by every turn of a chat session.
+
+    The excerpt sent to the model is built once per log rather than on each
+    message, and staying identical between turns keeps it in the prompt cache.
+    The log can be given as a file, which is then only read on the first turn.
+
+    The log may be replaced from the GUI thread while a chat worker is
+    building the excerpt, so both go through a lock.
+    """
+
+    def __init__(self, log_content: str = ""):
+        self._lock = threading.Lock()
+        # Bumped whenever the log is replaced
+        self._generation = 0
+        self.set_log_content(log_content)
+
+    def set_log_content(self, log_content: str) -> None:
+        """Replace the log text, discarding the previous excerpt."""
+        with self._lock:
+            self.log_content = log_content
+            self.log_path = None
+            self._log_digest = None
+            self._generation += 1
+
+    def set_log_path(self, log_path: str | Path) -> None:
+        """Take the log from a file, read when the excerpt is first needed."""
+        with self._lock:
+            self.log_content = None
+            self.log_path = Path(log_path)
+            self._log_digest = None
+            self._generation += 1
+
+    @property
+    def log_digest(self) -> str:
+        """Start and end of the log, bounded to CHAT_LOG_CHARS."""
+        with self._lock:
+            if self._log_digest is not None:
+                return self._log_digest
+            log_content, log_path = self.log_content, self.log_path
+            generation = self._generation
+
+        # Built outside the lock, since reading the file can take a while
+        if log_content is None:
+            digest = _file_log_digest(log_path, CHAT_LOG_CHARS, CHAT_HEAD_LINES)
+        else:
+            digest = _log_digest(log_content, CHAT_LOG_CHARS, CHAT_HEAD_LINES)
+
+        with self._lock:
+            # Only keep it if the log wasn't replaced in the meantime
+            if self._generation == generation:
+                self._log_digest = digest
+        return digest
+
+
+def _cached_text(text: str) -> list:
+    """
+    Wrap message text as a content part marked for prompt caching.
+
+    OpenRouter passes cache_control through to Anthropic, which caches the
+    prompt prefix up to this point for a few minutes so repeated requests
+    aren't billed for it again.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def _analysis_cache_path(log_content: str, failed_services: str) -> Path:
+    """Cache file for an analysis, keyed on everything that shapes the result."""
+    key = hashlib.blake2b(
+        b"\0".join([
+            log_content.encode(),
+            failed_services.encode(),
+            SYSTEM_PROMPT.encode(),
+            MODEL.encode()
+        ]),
+        digest_size=16
+    ).hexdigest()
+    return get_cache_dir() / f"analysis_{key}.json"
+
+
+def _load_cached_analysis(cache_file: Path) -> dict | None:
+    """Load a cached analysis if it exists and hasn't expired."""
+    try:
+        if cache_file.stat().st_mtime < time.time() - ANALYSIS_CACHE_TTL:
+            return None
+        result = orjson.loads(cache_file.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _analysis_cache_may_answer() -> bool:
+    """Whether the cache holds any analysis recent enough to be reused."""
+    cutoff = time.time() - ANALYSIS_CACHE_TTL
+    try:
+        return any(
+            cache_file.stat().st_mtime >= cutoff
+            for cache_file in get_cache_dir().glob("analysis_*.json")
+        )
+    except IOError:
+        return False
+
+
+def _store_cached_analysis(cache_file: Path, result: dict) -> None:
+    """Write an analysis to the cache; failures only cost a future cache miss."""
+    tmp_file = cache_file.with_suffix(".json.tmp")
+    try:
+        tmp_file.write_bytes(orjson.dumps(result))
+        os.replace(tmp_file, cache_file)
+    except IOError:
+        tmp_file.unlink(missing_ok=True)
+
+    _prune_analysis_cache()
+
+
+def _prune_analysis_cache() -> None:
+    """
+    Delete expired analyses.
+
+    Each boot's logs give a new cache key, so without this the cache
+    directory would keep growing. Also removes temp files left behind by
+    interrupted writes.
+    """
+    cutoff = time.time() - ANALYSIS_CACHE_TTL
+    for cache_file in get_cache_dir().glob("analysis_*.json*"):
+        try:
+            if cache_file.stat().st_mtime < cutoff:
+                cache_file.unlink()
+        except IOError:
+            # Removed by another process, or not ours to delete
+            pass
+
+
+def analyze_logs(
+    log_content: str,
+    failed_services: str = "",
+    on_progress: Callable[[str], None] | None = None,
+    use_cache: bool = True
+) -> dict:
     """
     Analyze boot logs using Claude via OpenRouter.
 
+    The response is streamed, so on_progress sees the model output as it
+    is generated. The JSON result is parsed once the stream ends.
+
+    Successful results are cached on disk for ANALYSIS_CACHE_TTL seconds,
+    so re-running on unchanged logs returns immediately without an API call.
+
     Args:
-        log_content: The boot log text to analyze.
+        log_content: The boot log text to analyze, already trimmed to the
+            portion worth sending (see log_capture.read_analysis_logs).
         failed_services: Output from systemctl --failed.
+        on_progress: Optional callback receiving each chunk of response text.
+        use_cache: If False, ignore any cached result and ask the model
+            again. The new result still replaces the cached one.
 
     Returns:
         Dictionary with issues and summary.
@@ -126,12 +608,20 @@ def analyze_logs(log_content: str, failed_services: str = "") -> dict:
             "summary": "Configuration error - API key missing"
         }
 
+    try:
+        cache_file = _analysis_cache_path(log_content, failed_services)
+    except IOError:
+        # No usable cache directory; analyze without the cache
+        cache_file = None
+    if use_cache and cache_file and (cached := _load_cached_analysis(cache_file)) is not None:
+        return cached
+
     # Prepare the log content for analysis
     user_content = f"""Analyze these Ubuntu boot logs and identify any significant issues:
 
 ## Boot Logs (journalctl)
 ```
-{log_content[-50000:]}  # Limit to last 50k chars
+{log_content}
 ```
 
 ## Failed Services (systemctl --failed)
@@ -143,40 +633,26 @@ Remember: Only flag genuine issues that need attention. Be conservative.
 """
 
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(
-                OPENROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://github.com/danielrosehill/Ubuntu-AI-Boot-Agent",
-                    "X-Title": "Ubuntu Boot Monitoring Agent"
-                },
-                json={
-                    "model": "anthropic/claude-sonnet-4",
-                    "messages": [
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": user_content}
-                    ],
-                    "temperature": 0.1,
-                    "max_tokens": 4096
-                }
-            )
-
-            response.raise_for_status()
-            result = response.json()
-
-            # Extract the content from Claude's response
-            content = result["choices"][0]["message"]["content"]
-
-            # Parse JSON from response
-            # Handle potential markdown code blocks
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-
-            return json.loads(content.strip())
+        # Claude's full response
+        content = _get_client(api_key).complete(
+            [
+                {"role": "system", "content": _cached_text(SYSTEM_PROMPT)},
+                {"role": "user", "content": user_content}
+            ],
+            temperature=0.1,
+            max_tokens=4096,
+            on_delta=on_progress
+        )
+
+        # Parse JSON from response
+        # Handle potential markdown code blocks
+        if match := _FENCE_RE.search(content):
+            content = match.group(1)
+
+        result = orjson.loads(content.strip())
+        if cache_file:
+            _store_cached_analysis(cache_file, result)
+        return result
 
     except httpx.HTTPStatusError as e:
         return {
@@ -189,7 +665,7 @@ Remember: Only flag genuine issues that need attention. Be conservative.
             }],
             "summary": f"API error: {e.response.status_code}"
         }
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return {
             "issues": [{
                 "severity": "warning",
@@ -215,7 +691,7 @@ Remember: Only flag genuine issues that need attention. Be conservative.
 
 def chat_with_context(
     message: str,
-    log_content: str,
+    log_content: "str | ChatContext",
     issue: dict = None,
     conversation_history: list = None
 ) -> str:
@@ -224,7 +700,8 @@ def chat_with_context(
 
     Args:
         message: The user's message.
-        log_content: The boot log text for context.
+        log_content: The boot log text for context, or a ChatContext that
+            is reused across turns.
         issue: Optional specific issue being discussed.
         conversation_history: List of previous messages [{"role": "user/assistant", "content": "..."}]
 
@@ -245,8 +722,11 @@ When suggesting commands:
 
 Be concise but thorough. Focus on practical solutions."""
 
+    if isinstance(log_content, str):
+        log_content = ChatContext(log_content)
+
     # Build context
-    context_parts = [f"## Boot Logs (last 30KB)\n```\n{log_content[-30000:]}\n```"]
+    context_parts = [f"## Boot Logs (start of boot and most recent entries)\n```\n{log_content.log_digest}\n```"]
 
     if issue:
         context_parts.append(f"""
@@ -263,7 +743,8 @@ Be concise but thorough. Focus on practical solutions."""
     # Build messages
     messages = [
         {"role": "system", "content": chat_system},
-        {"role": "user", "content": f"Here is the context for our conversation:\n\n{context}\n\nPlease acknowledge you have this context."},
+        # Cached so follow-up turns don't re-bill the log context
+        {"role": "user", "content": _cached_text(f"Here is the context for our conversation:\n\n{context}\n\nPlease acknowledge you have this context.")},
         {"role": "assistant", "content": "I have the boot logs and issue context. I'm ready to help you diagnose and fix any problems. What would you like to know?"}
     ]
 
@@ -275,26 +756,7 @@ Be concise but thorough. Focus on practical solutions."""
     messages.append({"role": "user", "content": message})
 
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(
-                OPENROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://github.com/danielrosehill/Ubuntu-AI-Boot-Agent",
-                    "X-Title": "Ubuntu Boot Monitoring Agent"
-                },
-                json={
-                    "model": "anthropic/claude-sonnet-4",
-                    "messages": messages,
-                    "temperature": 0.3,
-                    "max_tokens": 2048
-                }
-            )
-
-            response.raise_for_status()
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
+        return _get_client(api_key).complete(messages, temperature=0.3, max_tokens=2048)
 
     except Exception as e:
         return f"Error: {str(e)}"
@@ -1,8 +1,13 @@
 """PyQt6 GUI for Ubuntu Boot Monitoring Agent."""
 
+import html
 import re
+import shlex
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -13,7 +18,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QScrollArea,
     QFrame,
     QMessageBox,
@@ -21,49 +26,137 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
     QLineEdit,
     QSplitter,
+    QToolTip,
+)
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QCursor, QFont, QTextBlockFormat, QTextCharFormat, QTextCursor
+
+from .log_capture import (
+    capture_boot_logs,
+    get_failed_services,
+    iter_log_chunks,
+    read_analysis_logs,
+)
+from .analyzer import (
+    ChatContext,
+    analyze_logs,
+    chat_with_context,
+    get_api_key,
+    save_api_key,
+    warm_up_connection,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QTextCursor
 
-from .log_capture import capture_boot_logs, capture_priority_logs, get_failed_services
-from .analyzer import analyze_logs, chat_with_context, get_api_key, save_api_key
+
+# Markdown patterns for rendering assistant messages
+_RE_CODE_BLOCK = re.compile(r'```(?:\w+)?\n?(.*?)```', re.DOTALL)
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_RE_ITALIC = re.compile(r'\*([^*]+)\*')
+_RE_H3 = re.compile(r'^### (.+)$', re.MULTILINE)
+_RE_H2 = re.compile(r'^## (.+)$', re.MULTILINE)
+_RE_H1 = re.compile(r'^# (.+)$', re.MULTILINE)
+_RE_BULLET = re.compile(r'^- (.+)$', re.MULTILINE)
+_RE_NUMBERED = re.compile(r'^(\d+)\. (.+)$', re.MULTILINE)
+
+# Characters that need a shell to interpret (pipes, redirects, globs, ...)
+_RE_SHELL_SYNTAX = re.compile(r'[|&;<>()$`\n*?\[\]{}~#!]')
+
+
+def remediation_argv(command: str) -> list[str] | None:
+    """
+    Split a simple command into argv so it can be run without a shell.
+
+    Returns None if the command uses shell syntax (pipes, redirects,
+    substitutions, globs, variable assignments) or starts with a shell
+    builtin, in which case it has to go through /bin/sh.
+    """
+    if _RE_SHELL_SYNTAX.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
+_SEVERITY_BADGE_HTML = (
+    "<span style='background-color: {color}; color: white; padding: 2px 8px; "
+    "border-radius: 3px; font-weight: bold;'>{label}</span>"
+)
 
 
-class AnalysisWorker(QThread):
-    """Background worker for log analysis."""
+class AnalysisSignals(QObject):
+    """Signals emitted by AnalysisTask."""
 
-    finished = pyqtSignal(dict, str, str)  # results, log_path, log_content
+    status = pyqtSignal(str)  # description of the current step
+    partial = pyqtSignal(dict, str)  # results, analyzed log_content; before the full log is ready
+    finished = pyqtSignal(dict, str)  # results, log_path
+    progress = pyqtSignal(str)  # chunk of streamed AI response
     error = pyqtSignal(str)
 
+
+class AnalysisTask(QRunnable):
+    """Background task for log analysis, run on the global thread pool."""
+
+    def __init__(self, use_cache: bool = True):
+        super().__init__()
+        # Kept alive by the owner rather than deleted by the pool
+        self.setAutoDelete(False)
+        self.use_cache = use_cache
+        self.signals = AnalysisSignals()
+
     def run(self):
         try:
-            # Capture logs
-            log_path = capture_priority_logs()
-            full_log_path = capture_boot_logs()
-            failed_services = get_failed_services()
-
-            # Read log content
-            log_content = log_path.read_text()
-            full_log_content = full_log_path.read_text()
+            # Connect to the API while journalctl is running
+            threading.Thread(target=warm_up_connection, args=(self.use_cache,), daemon=True).start()
+
+            # Capture logs; each is a separate subprocess, so run them side by side.
+            # Only the priority-filtered excerpt is needed for analysis, so the
+            # full log keeps capturing while the model works.
+            self.signals.status.emit("Capturing boot logs...")
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                log_future = executor.submit(read_analysis_logs)
+                full_log_future = executor.submit(capture_boot_logs)
+                failed_future = executor.submit(get_failed_services)
+                log_content = log_future.result()
+                failed_services = failed_future.result()
+
+                # Analyze
+                self.signals.status.emit("Analyzing boot logs...")
+                results = analyze_logs(
+                    log_content,
+                    failed_services,
+                    on_progress=self.signals.progress.emit,
+                    use_cache=self.use_cache
+                )
+                self.signals.partial.emit(results, log_content)
 
-            # Analyze
-            results = analyze_logs(log_content, failed_services)
+                full_log_path = full_log_future.result()
 
-            self.finished.emit(results, str(full_log_path), full_log_content)
+            self.signals.finished.emit(results, str(full_log_path))
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
-class ChatWorker(QThread):
-    """Background worker for chat responses."""
+class ChatSignals(QObject):
+    """Signals emitted by ChatTask."""
 
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, message: str, log_content: str, issue: dict = None, history: list = None):
+
+class ChatTask(QRunnable):
+    """Background task for chat responses, run on the global thread pool."""
+
+    def __init__(self, message: str, context: ChatContext, issue: dict = None, history: list = None):
         super().__init__()
+        # Kept alive by the owner rather than deleted by the pool
+        self.setAutoDelete(False)
+        self.signals = ChatSignals()
         self.message = message
-        self.log_content = log_content
+        self.context = context
         self.issue = issue
         self.history = history or []
 
@@ -71,13 +164,46 @@ class ChatWorker(QThread):
         try:
             response = chat_with_context(
                 self.message,
-                self.log_content,
+                self.context,
                 self.issue,
                 self.history
             )
-            self.finished.emit(response)
+            self.signals.finished.emit(response)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+class LogLoadSignals(QObject):
+    """Signals emitted by LogLoadTask."""
+
+    chunk = pyqtSignal(str)  # block of whole log lines
+    error = pyqtSignal(str)
+
+
+class LogLoadTask(QRunnable):
+    """Background task that reads a log file in chunks for display."""
+
+    def __init__(self, log_path: str, max_bytes: int | None = None):
+        super().__init__()
+        # Kept alive by the owner rather than deleted by the pool
+        self.setAutoDelete(False)
+        self.signals = LogLoadSignals()
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop reading at the next chunk."""
+        self.cancelled = True
+
+    def run(self):
+        try:
+            for chunk in iter_log_chunks(Path(self.log_path), self.max_bytes):
+                if self.cancelled:
+                    return
+                self.signals.chunk.emit(chunk)
+        except Exception as e:
+            self.signals.error.emit(str(e))
 
 
 class LogSnippetDialog(QDialog):
@@ -96,7 +222,7 @@ class LogSnippetDialog(QDialog):
         layout.addWidget(problem_label)
 
         # Log snippet
-        snippet_text = QTextEdit()
+        snippet_text = QPlainTextEdit()
         snippet_text.setReadOnly(True)
         snippet_text.setFont(QFont("Monospace", 10))
         snippet_text.setPlainText(issue.get("log_snippet", "No log snippet available"))
@@ -114,6 +240,31 @@ class IssueWidget(QFrame):
 
     fix_this_clicked = pyqtSignal(dict)  # Signal to send issue to chatbot
 
+    # Shared stylesheets, so every instance hands Qt the same strings
+    _DETAILS_QSS = "color: #666666; font-size: 11px; margin-left: 10px;"
+    _REM_FRAME_QSS = "background-color: #f8f9fa; border: 1px solid #dee2e6; border-radius: 4px;"
+    _SNIPPET_BTN_QSS = "background-color: #6c757d; color: white; padding: 5px 10px;"
+    _FIX_BTN_QSS = "background-color: #0d6efd; color: white; padding: 5px 10px;"
+    _RUN_BTN_QSS = "background-color: #198754; color: white; padding: 5px 10px;"
+    _COPY_BTN_QSS = "padding: 5px 10px;"
+
+    # Severity levels and their badge colours
+    _SEVERITY_COLORS = {
+        "urgent": "#dc3545",    # Red
+        "moderate": "#fd7e14",  # Orange
+        "mild": "#0d6efd",      # Blue
+        # Legacy support
+        "critical": "#dc3545",
+        "warning": "#fd7e14",
+        "notice": "#0d6efd"
+    }
+    _DEFAULT_SEVERITY_COLOR = "#6c757d"
+    # Badge markup for each known severity, built once
+    _SEVERITY_BADGE = {
+        severity: _SEVERITY_BADGE_HTML.format(color=color, label=severity.upper())
+        for severity, color in _SEVERITY_COLORS.items()
+    }
+
     def __init__(self, issue: dict, parent=None):
         super().__init__(parent)
         self.issue = issue
@@ -128,19 +279,15 @@ class IssueWidget(QFrame):
 
         # Severity indicator with new levels
         severity = self.issue.get("severity", "mild")
-        severity_colors = {
-            "urgent": "#dc3545",    # Red
-            "moderate": "#fd7e14",  # Orange
-            "mild": "#0d6efd",      # Blue
-            # Legacy support
-            "critical": "#dc3545",
-            "warning": "#fd7e14",
-            "notice": "#0d6efd"
-        }
-        color = severity_colors.get(severity, "#6c757d")
+        badge = self._SEVERITY_BADGE.get(severity)
+        if badge is None:
+            badge = _SEVERITY_BADGE_HTML.format(
+                color=self._DEFAULT_SEVERITY_COLOR,
+                label=html.escape(str(severity).upper(), quote=False)
+            )
 
         # Header with severity badge
-        header = QLabel(f"<span style='background-color: {color}; color: white; padding: 2px 8px; border-radius: 3px; font-weight: bold;'>{severity.upper()}</span> {self.issue.get('problem', 'Unknown issue')}")
+        header = QLabel(f"{badge} {self.issue.get('problem', 'Unknown issue')}")
         header.setWordWrap(True)
         layout.addWidget(header)
 
@@ -148,13 +295,13 @@ class IssueWidget(QFrame):
         if details := self.issue.get("details"):
             details_label = QLabel(details)
             details_label.setWordWrap(True)
-            details_label.setStyleSheet("color: #666666; font-size: 11px; margin-left: 10px;")
+            details_label.setStyleSheet(self._DETAILS_QSS)
             layout.addWidget(details_label)
 
         # Remediation
         if remediation := self.issue.get("remediation"):
             rem_frame = QFrame()
-            rem_frame.setStyleSheet("background-color: #f8f9fa; border: 1px solid #dee2e6; border-radius: 4px;")
+            rem_frame.setStyleSheet(self._REM_FRAME_QSS)
             rem_layout = QVBoxLayout(rem_frame)
             rem_layout.setContentsMargins(8, 8, 8, 8)
 
@@ -177,24 +324,24 @@ class IssueWidget(QFrame):
         if self.issue.get("log_snippet"):
             snippet_btn = QPushButton("See Log Snippet")
             snippet_btn.clicked.connect(self.show_log_snippet)
-            snippet_btn.setStyleSheet("background-color: #6c757d; color: white; padding: 5px 10px;")
+            snippet_btn.setStyleSheet(self._SNIPPET_BTN_QSS)
             btn_layout.addWidget(snippet_btn)
 
         # Fix This button (sends to chatbot)
         fix_btn = QPushButton("Fix This")
         fix_btn.clicked.connect(lambda: self.fix_this_clicked.emit(self.issue))
-        fix_btn.setStyleSheet("background-color: #0d6efd; color: white; padding: 5px 10px;")
+        fix_btn.setStyleSheet(self._FIX_BTN_QSS)
         btn_layout.addWidget(fix_btn)
 
         if self.issue.get("safe_to_auto_run", False):
             run_btn = QPushButton("Run Fix")
             run_btn.clicked.connect(self.run_remediation)
-            run_btn.setStyleSheet("background-color: #198754; color: white; padding: 5px 10px;")
+            run_btn.setStyleSheet(self._RUN_BTN_QSS)
             btn_layout.addWidget(run_btn)
 
         copy_btn = QPushButton("Copy Command")
         copy_btn.clicked.connect(self.copy_remediation)
-        copy_btn.setStyleSheet("padding: 5px 10px;")
+        copy_btn.setStyleSheet(self._COPY_BTN_QSS)
         btn_layout.addWidget(copy_btn)
 
         btn_layout.addStretch()
@@ -220,10 +367,11 @@ class IssueWidget(QFrame):
 
         if msg.exec() == QMessageBox.StandardButton.Yes:
             try:
-                # Run command
+                # Run simple commands directly; only use a shell when needed
+                argv = remediation_argv(remediation)
                 result = subprocess.run(
-                    remediation,
-                    shell=True,
+                    argv if argv is not None else remediation,
+                    shell=argv is None,
                     capture_output=True,
                     text=True,
                     timeout=30
@@ -256,8 +404,8 @@ class IssueWidget(QFrame):
         clipboard = QApplication.clipboard()
         clipboard.setText(remediation)
 
-        # Brief feedback
-        QMessageBox.information(self, "Copied", "Command copied to clipboard")
+        # Brief, non-modal feedback
+        QToolTip.showText(QCursor.pos(), "Copied to clipboard", self, self.rect(), 1500)
 
 
 class LogViewerDialog(QDialog):
@@ -270,18 +418,11 @@ class LogViewerDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # Log text area
-        self.text_edit = QTextEdit()
+        # Log text area; plain-text layout keeps large logs fast to load
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
         self.text_edit.setFont(QFont("Monospace", 9))
 
-        # Load log content
-        try:
-            log_content = Path(log_path).read_text()
-            self.text_edit.setPlainText(log_content)
-        except Exception as e:
-            self.text_edit.setPlainText(f"Error loading logs: {e}")
-
         layout.addWidget(self.text_edit)
 
         # Buttons
@@ -289,6 +430,24 @@ class LogViewerDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+        # Load log content in the background so the dialog opens immediately
+        self.load_task = LogLoadTask(log_path)
+        self.load_task.signals.chunk.connect(self.append_chunk)
+        self.load_task.signals.error.connect(self.on_load_error)
+        self.finished.connect(self.load_task.cancel)
+        QThreadPool.globalInstance().start(self.load_task)
+
+    def append_chunk(self, chunk: str):
+        """Add loaded lines without moving the view, so it opens at the start of boot."""
+        scrollbar = self.text_edit.verticalScrollBar()
+        position = scrollbar.value()
+        self.text_edit.appendPlainText(chunk)
+        scrollbar.setValue(position)
+
+    def on_load_error(self, error: str):
+        """Show a log loading error in the viewer."""
+        self.text_edit.appendPlainText(f"Error loading logs: {error}")
+
 
 class SettingsDialog(QDialog):
     """Dialog for configuring application settings."""
@@ -358,9 +517,19 @@ class SettingsDialog(QDialog):
 class ChatPanel(QWidget):
     """Chat panel for interactive remediation assistance."""
 
+    # Applied to the chat document once; messages only carry class names.
+    # Only character formats work here: the plain text layout ignores margins.
+    _MESSAGE_CSS = (
+        ".user { color: #0d6efd; font-weight: bold; }"
+        ".assistant { color: #198754; font-weight: bold; }"
+        ".system { color: #6c757d; font-weight: bold; }"
+        ".error { color: #dc3545; font-weight: bold; }"
+        ".other { font-weight: bold; }"
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.log_content = ""
+        self.context = ChatContext()
         self.current_issue = None
         self.conversation_history = []
         self.setup_ui()
@@ -374,16 +543,19 @@ class ChatPanel(QWidget):
         layout.addWidget(header)
 
         # Chat history display
-        self.chat_display = QTextEdit()
+        self.chat_display = QPlainTextEdit()
         self.chat_display.setReadOnly(True)
         self.chat_display.setFont(QFont("Sans", 10))
+        # Oldest lines are discarded past this, keeping appends constant-time
+        self.chat_display.setMaximumBlockCount(2000)
         self.chat_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #f8f9fa;
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
             }
         """)
+        self.chat_display.document().setDefaultStyleSheet(self._MESSAGE_CSS)
         layout.addWidget(self.chat_display, 1)
 
         # Input area
@@ -412,8 +584,12 @@ class ChatPanel(QWidget):
         self.add_message("assistant", "I have access to your boot logs. Click 'Fix This' on any issue, or ask me questions about your system.")
 
     def set_log_content(self, content: str):
-        """Set the log content for context."""
-        self.log_content = content
+        """Set the log text for context."""
+        self.context.set_log_content(content)
+
+    def set_log_path(self, log_path: str):
+        """Set the log file for context; it is read on the first question."""
+        self.context.set_log_path(log_path)
 
     def focus_on_issue(self, issue: dict):
         """Focus chat on a specific issue."""
@@ -449,15 +625,15 @@ class ChatPanel(QWidget):
         """Get AI response in background."""
         self.chat_input.setEnabled(False)
 
-        self.worker = ChatWorker(
+        self.worker = ChatTask(
             message,
-            self.log_content,
+            self.context,
             self.current_issue,
             self.conversation_history[:-1]  # Exclude the message we just added
         )
-        self.worker.finished.connect(self.on_response_received)
-        self.worker.error.connect(self.on_response_error)
-        self.worker.start()
+        self.worker.signals.finished.connect(self.on_response_received)
+        self.worker.signals.error.connect(self.on_response_error)
+        QThreadPool.globalInstance().start(self.worker)
 
     def on_response_received(self, response: str):
         """Handle AI response."""
@@ -474,34 +650,34 @@ class ChatPanel(QWidget):
     def markdown_to_html(self, text: str) -> str:
         """Convert basic markdown to HTML."""
         # Escape HTML first
-        text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        text = html.escape(text, quote=False)
 
         # Code blocks (```...```)
         def replace_code_block(match):
             code = match.group(1)
             return f"<pre style='background-color: #e9ecef; padding: 8px; border-radius: 4px; font-family: monospace; overflow-x: auto;'>{code}</pre>"
 
-        text = re.sub(r'```(?:\w+)?\n?(.*?)```', replace_code_block, text, flags=re.DOTALL)
+        text = _RE_CODE_BLOCK.sub(replace_code_block, text)
 
         # Inline code (`...`)
-        text = re.sub(r'`([^`]+)`', r"<code style='background-color: #e9ecef; padding: 2px 4px; border-radius: 3px; font-family: monospace;'>\1</code>", text)
+        text = _RE_INLINE_CODE.sub(r"<code style='background-color: #e9ecef; padding: 2px 4px; border-radius: 3px; font-family: monospace;'>\1</code>", text)
 
         # Bold (**...**)
-        text = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', text)
+        text = _RE_BOLD.sub(r'<b>\1</b>', text)
 
         # Italic (*...*)
-        text = re.sub(r'\*([^*]+)\*', r'<i>\1</i>', text)
+        text = _RE_ITALIC.sub(r'<i>\1</i>', text)
 
         # Headers (### ... )
-        text = re.sub(r'^### (.+)$', r'<b style="font-size: 14px;">\1</b>', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+)$', r'<b style="font-size: 15px;">\1</b>', text, flags=re.MULTILINE)
-        text = re.sub(r'^# (.+)$', r'<b style="font-size: 16px;">\1</b>', text, flags=re.MULTILINE)
+        text = _RE_H3.sub(r'<b style="font-size: 14px;">\1</b>', text)
+        text = _RE_H2.sub(r'<b style="font-size: 15px;">\1</b>', text)
+        text = _RE_H1.sub(r'<b style="font-size: 16px;">\1</b>', text)
 
         # Bullet lists (- item)
-        text = re.sub(r'^- (.+)$', r'&bull; \1', text, flags=re.MULTILINE)
+        text = _RE_BULLET.sub(r'&bull; \1', text)
 
         # Numbered lists (1. item) - simple version
-        text = re.sub(r'^(\d+)\. (.+)$', r'\1. \2', text, flags=re.MULTILINE)
+        text = _RE_NUMBERED.sub(r'\1. \2', text)
 
         # Line breaks
         text = text.replace("\n", "<br>")
@@ -510,12 +686,6 @@ class ChatPanel(QWidget):
 
     def add_message(self, role: str, content: str):
         """Add a message to the chat display."""
-        colors = {
-            "user": "#0d6efd",
-            "assistant": "#198754",
-            "system": "#6c757d",
-            "error": "#dc3545"
-        }
         labels = {
             "user": "You",
             "assistant": "AI Assistant",
@@ -523,29 +693,26 @@ class ChatPanel(QWidget):
             "error": "Error"
         }
 
-        color = colors.get(role, "#000000")
-        label = labels.get(role, role.title())
+        label = html.escape(labels.get(role, role.title()), quote=False)
 
         # Convert markdown to HTML for assistant messages
         if role == "assistant":
             formatted_content = self.markdown_to_html(content)
         else:
             # For user/system messages, just escape and convert newlines
-            formatted_content = content.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            formatted_content = html.escape(content, quote=False)
             formatted_content = formatted_content.replace("\n", "<br>")
 
-        html = f"""
-        <div style='margin-bottom: 10px;'>
-            <span style='color: {color}; font-weight: bold;'>{label}:</span><br>
-            <div style='margin-left: 10px; margin-top: 4px;'>{formatted_content}</div>
-        </div>
-        """
+        role_class = role if role in labels else "other"
+        message_html = f"<p><span class='{role_class}'>{label}:</span><br>{formatted_content}</p>"
 
-        cursor = self.chat_display.textCursor()
+        self.chat_display.appendHtml(message_html)
+        # The plain text layout ignores paragraph margins, so separate
+        # messages with an empty line instead. It gets default formats so it
+        # doesn't continue the message's last block (e.g. a grey code block).
+        cursor = QTextCursor(self.chat_display.document())
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.chat_display.setTextCursor(cursor)
-        self.chat_display.insertHtml(html)
-        self.chat_display.insertPlainText("\n")
+        cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
 
         # Scroll to bottom
         scrollbar = self.chat_display.verticalScrollBar()
@@ -562,10 +729,14 @@ class ChatPanel(QWidget):
 class MainWindow(QMainWindow):
     """Main application window with two-panel layout."""
 
+    # Issue widgets are created this many at a time, as the list is scrolled
+    _ISSUE_BATCH_SIZE = 10
+
     def __init__(self):
         super().__init__()
         self.log_path = None
-        self.log_content = ""
+        self.received_chars = 0
+        self.pending_issues = []
         self.setup_ui()
         self.start_analysis()
 
@@ -591,7 +762,8 @@ class MainWindow(QMainWindow):
         header_layout.addWidget(self.view_logs_btn)
 
         refresh_btn = QPushButton("Re-analyze")
-        refresh_btn.clicked.connect(self.start_analysis)
+        # Re-analyzing means asking the model again, not reusing a cached answer
+        refresh_btn.clicked.connect(lambda: self.start_analysis(use_cache=False))
         header_layout.addWidget(refresh_btn)
 
         settings_btn = QPushButton("Settings")
@@ -625,17 +797,22 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(issues_header)
 
         # Scroll area for issues
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: 1px solid #dee2e6; }")
+        self.issues_scroll = QScrollArea()
+        self.issues_scroll.setWidgetResizable(True)
+        self.issues_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.issues_scroll.setStyleSheet("QScrollArea { border: 1px solid #dee2e6; }")
+
+        # Build more issue widgets as the user nears the end of the list
+        scrollbar = self.issues_scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self.load_more_issues_if_needed)
+        scrollbar.rangeChanged.connect(self.load_more_issues_if_needed)
 
         self.issues_container = QWidget()
         self.issues_layout = QVBoxLayout(self.issues_container)
         self.issues_layout.addStretch()
 
-        scroll.setWidget(self.issues_container)
-        left_layout.addWidget(scroll, 1)
+        self.issues_scroll.setWidget(self.issues_container)
+        left_layout.addWidget(self.issues_scroll, 1)
 
         splitter.addWidget(left_panel)
 
@@ -648,31 +825,47 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(splitter, 1)
 
-    def start_analysis(self):
+    def start_analysis(self, use_cache: bool = True):
         """Start background log analysis."""
         self.status_label.setText("Analyzing boot logs...")
         self.status_label.setStyleSheet("")
         self.summary_label.setText("")
 
-        # Clear previous issues
-        while self.issues_layout.count() > 1:
-            item = self.issues_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Clear previous issues; repaint once at the end rather than per removal
+        self.pending_issues = []
+        self.issues_container.setUpdatesEnabled(False)
+        try:
+            # Take from the end (skipping the trailing stretch) so nothing shifts
+            for i in range(self.issues_layout.count() - 2, -1, -1):
+                item = self.issues_layout.takeAt(i)
+                if item.widget():
+                    item.widget().deleteLater()
+        finally:
+            self.issues_container.setUpdatesEnabled(True)
 
         # Start worker
-        self.worker = AnalysisWorker()
-        self.worker.finished.connect(self.on_analysis_complete)
-        self.worker.error.connect(self.on_analysis_error)
-        self.worker.start()
-
-    def on_analysis_complete(self, results: dict, log_path: str, log_content: str):
-        """Handle completed analysis."""
-        self.log_path = log_path
-        self.log_content = log_content
-        self.view_logs_btn.setEnabled(True)
-
-        # Pass log content to chat panel
+        self.received_chars = 0
+        self.worker = AnalysisTask(use_cache)
+        self.worker.signals.status.connect(self.on_analysis_status)
+        self.worker.signals.partial.connect(self.on_analysis_results)
+        self.worker.signals.finished.connect(self.on_analysis_complete)
+        self.worker.signals.progress.connect(self.on_analysis_progress)
+        self.worker.signals.error.connect(self.on_analysis_error)
+        QThreadPool.globalInstance().start(self.worker)
+
+    def on_analysis_status(self, status: str):
+        """Show which step of the analysis is running."""
+        self.status_label.setText(status)
+
+    def on_analysis_progress(self, chunk: str):
+        """Show progress while the AI response streams in."""
+        self.received_chars += len(chunk)
+        self.status_label.setText(f"Receiving analysis... ({self.received_chars} characters)")
+
+    def on_analysis_results(self, results: dict, log_content: str):
+        """Show the issues as soon as the AI has answered."""
+        # "Fix This" can be clicked straight away, so the chat needs a log
+        # now; the excerpt the analysis used stands in until the full log is ready
         self.chat_panel.set_log_content(log_content)
 
         issues = results.get("issues", [])
@@ -706,11 +899,45 @@ class MainWindow(QMainWindow):
 
         self.summary_label.setText(summary)
 
-        # Add issue widgets
-        for issue in issues:
-            widget = IssueWidget(issue)
-            widget.fix_this_clicked.connect(self.chat_panel.focus_on_issue)
-            self.issues_layout.insertWidget(self.issues_layout.count() - 1, widget)
+        # Add issue widgets; the rest are built on demand while scrolling
+        self.pending_issues = list(issues)
+        self.add_issue_batch()
+
+    def on_analysis_complete(self, results: dict, log_path: str):
+        """Handle completed analysis once the full log has been captured."""
+        self.log_path = log_path
+        self.view_logs_btn.setEnabled(True)
+
+        # Give the chat panel the log file; it is only read if the user asks something
+        self.chat_panel.set_log_path(log_path)
+
+    def add_issue_batch(self):
+        """Create widgets for the next batch of pending issues."""
+        batch = self.pending_issues[:self._ISSUE_BATCH_SIZE]
+        del self.pending_issues[:self._ISSUE_BATCH_SIZE]
+
+        # Repaint once for the whole batch rather than per inserted widget
+        self.issues_container.setUpdatesEnabled(False)
+        try:
+            for issue in batch:
+                widget = IssueWidget(issue)
+                widget.fix_this_clicked.connect(self.chat_panel.focus_on_issue)
+                self.issues_layout.insertWidget(self.issues_layout.count() - 1, widget)
+        finally:
+            self.issues_container.setUpdatesEnabled(True)
+
+        # If the batch doesn't fill the view there is nothing to scroll, so
+        # check again once the layout has settled
+        if self.pending_issues:
+            QTimer.singleShot(0, self.load_more_issues_if_needed)
+
+    def load_more_issues_if_needed(self, *_):
+        """Add another batch of issues when the list is scrolled near its end."""
+        if not self.pending_issues:
+            return
+        scrollbar = self.issues_scroll.verticalScrollBar()
+        if scrollbar.value() >= scrollbar.maximum() - scrollbar.pageStep():
+            self.add_issue_batch()
 
     def on_analysis_error(self, error: str):
         """Handle analysis error."""
@@ -2,25 +2,15 @@
 
 import subprocess
 import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 
-
-def get_boot_id() -> str:
-    """Get the current boot ID."""
-    result = subprocess.run(
-        ["journalctl", "--list-boots", "-o", "json"],
-        capture_output=True,
-        text=True
-    )
-    # Get current boot (index 0)
-    result = subprocess.run(
-        ["journalctl", "--boot", "0", "-o", "short", "-n", "1", "--output-fields=_BOOT_ID"],
-        capture_output=True,
-        text=True
-    )
-    # Alternative: just use -b 0 for current boot
-    return "0"
+# Log tail sent for analysis. Journal text runs ~3-4 characters per token, so
+# this is roughly 40-50K tokens: well inside Claude's context window while
+# leaving room for the prompt and response.
+MAX_LOG_BYTES = 160_000
 
 
 def capture_boot_logs(output_path: Path | None = None) -> Path:
@@ -45,22 +35,16 @@ def capture_boot_logs(output_path: Path | None = None) -> Path:
     # --no-pager = don't paginate
     # -p 0..4 = emerg, alert, crit, err, warning (skip info/debug for analysis)
     # Also get priority 5 (notice) and 6 (info) for context
-    result = subprocess.run(
+    return _capture_to_file(
         [
             "journalctl",
             "-b", "0",           # Current boot only
             "--no-pager",
             "-o", "short-iso",   # Timestamp format
         ],
-        capture_output=True,
-        text=True
+        output_path
     )
 
-    # Write to file
-    output_path.write_text(result.stdout)
-
-    return output_path
-
 
 def capture_priority_logs(output_path: Path | None = None, max_priority: int = 4) -> Path:
     """
@@ -76,22 +60,164 @@ def capture_priority_logs(output_path: Path | None = None, max_priority: int = 4
     if output_path is None:
         output_path = Path(tempfile.gettempdir()) / f"boot_errors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
-    result = subprocess.run(
-        [
-            "journalctl",
-            "-b", "0",
-            "--no-pager",
-            "-p", f"0..{max_priority}",  # Only warnings and above
-            "-o", "short-iso",
-        ],
-        capture_output=True,
-        text=True
-    )
+    return _capture_to_file(_priority_logs_command(max_priority), output_path)
+
+
+def _capture_to_file(command: list[str], output_path: Path) -> Path:
+    """
+    Run a command with its stdout attached directly to output_path.
+
+    The child writes into the file descriptor itself, so the log never
+    passes through a pipe or a Python buffer, whatever its size.
+    """
+    with output_path.open("wb") as f:
+        subprocess.run(command, stdout=f, stderr=subprocess.DEVNULL, check=False)
 
-    output_path.write_text(result.stdout)
     return output_path
 
 
+def _priority_logs_command(max_priority: int) -> list[str]:
+    """journalctl command for warning/error level logs from current boot."""
+    return [
+        "journalctl",
+        "-b", "0",
+        "--no-pager",
+        "-p", f"0..{max_priority}",  # Only warnings and above
+        "-o", "short-iso",
+    ]
+
+
+def iter_priority_logs(max_priority: int = 4) -> Iterator[bytes]:
+    """
+    Stream warning/error level logs from current boot, line by line.
+
+    Unlike capture_priority_logs(), nothing is written to disk.
+
+    Args:
+        max_priority: Maximum priority level (0=emerg, 4=warning, 6=info).
+
+    Yields:
+        Raw log lines, including the trailing newline.
+    """
+    with subprocess.Popen(
+        _priority_logs_command(max_priority),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    ) as proc:
+        yield from proc.stdout
+
+
+def tail_lines(lines: Iterable[bytes], max_bytes: int = MAX_LOG_BYTES) -> str:
+    """
+    Keep the last lines of a log stream that fit within max_bytes.
+
+    Only the retained window is held in memory, however long the stream is.
+
+    Args:
+        lines: Raw log lines, e.g. from iter_priority_logs().
+        max_bytes: Maximum total size of the lines kept.
+
+    Returns:
+        The decoded tail of the stream.
+    """
+    tail = deque()
+    size = 0
+    for line in lines:
+        tail.append(line)
+        size += len(line)
+        while size > max_bytes:
+            size -= len(tail.popleft())
+
+    return b"".join(tail).decode("utf-8", errors="replace")
+
+
+def read_analysis_logs(max_priority: int = 4, max_bytes: int = MAX_LOG_BYTES) -> str:
+    """
+    Get the log excerpt sent for analysis.
+
+    This is the most recent warning-or-worse entries of the current boot.
+    Both the CLI and the GUI use it, so the same boot gives the same input
+    (and the same analysis cache entry) whichever one runs.
+
+    Args:
+        max_priority: Maximum priority level (0=emerg, 4=warning, 6=info).
+        max_bytes: Maximum size of the excerpt.
+
+    Returns:
+        The decoded tail of the priority-filtered log.
+    """
+    return tail_lines(iter_priority_logs(max_priority), max_bytes)
+
+
+def read_log_tail(log_path: Path, max_bytes: int = MAX_LOG_BYTES) -> str:
+    """
+    Read the end of a captured log file.
+
+    Only the last max_bytes are read and decoded, so large boot logs don't
+    have to be loaded into memory just to be truncated.
+
+    Args:
+        log_path: Path to the captured log file.
+        max_bytes: Maximum number of bytes to read from the end of the file.
+
+    Returns:
+        The tail of the log, starting at a line boundary.
+    """
+    with log_path.open("rb") as f:
+        size = f.seek(0, 2)
+        start = max(0, size - max_bytes)
+        # Starting one byte early means a line that begins exactly at start
+        # is preceded by its newline, and so isn't mistaken for a partial one
+        f.seek(max(0, start - 1))
+        tail = f.read()
+
+    # Drop the partial first line when starting mid-file
+    if start > 0:
+        newline = tail.find(b"\n")
+        tail = tail[newline + 1:] if newline != -1 else b""
+
+    return tail.decode("utf-8", errors="replace")
+
+
+def iter_log_chunks(
+    log_path: Path,
+    max_bytes: int | None = None,
+    chunk_size: int = 65536
+) -> Iterator[str]:
+    """
+    Read a captured log file in decoded chunks that end on line boundaries.
+
+    Args:
+        log_path: Path to the captured log file.
+        max_bytes: If given, only read (roughly) the last max_bytes of the
+            file, starting at a line boundary.
+        chunk_size: Number of bytes to read at a time.
+
+    Yields:
+        Blocks of whole lines, without the final newline.
+    """
+    with log_path.open("rb") as f:
+        size = f.seek(0, 2)
+        start = 0 if max_bytes is None else max(0, size - max_bytes)
+        # Back up a byte so a line starting exactly at start is kept
+        f.seek(max(0, start - 1))
+        if start > 0:
+            f.readline()  # Skip the partial first line
+
+        remainder = b""
+        while block := f.read(chunk_size):
+            block = remainder + block
+            cut = block.rfind(b"\n")
+            if cut == -1:
+                remainder = block
+                continue
+            remainder = block[cut + 1:]
+            yield block[:cut].decode("utf-8", errors="replace")
+
+        if remainder:
+            yield remainder.decode("utf-8", errors="replace")
+
+
 def get_dmesg_logs() -> str:
     """Get kernel ring buffer logs."""
     result = subprocess.run(
@@ -100,7 +100,7 @@ Version: $VERSION
 Section: utils
 Priority: optional
 Architecture: $ARCH
-Depends: python3 (>= 3.12), python3-pyqt6, python3-httpx, python3-dotenv
+Depends: python3 (>= 3.12), python3-pyqt6, python3-httpx, python3-h2, python3-orjson
 Maintainer: Daniel Rosehill <public@danielrosehill.com>
 Description: AI-powered boot log analysis for Ubuntu
  Ubuntu Boot Monitoring Agent analyzes system boot logs using AI
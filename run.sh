@@ -4,8 +4,12 @@
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 cd "$SCRIPT_DIR"
 
-# Check for .env
-if [ ! -f ".env" ]; then
+# Load .env into the environment if present
+if [ -f ".env" ]; then
+    set -a
+    . ./.env
+    set +a
+else
     echo "Warning: No .env file found. Create one with OPENROUTER_API_KEY=your-key"
 fi
 